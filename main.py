@@ -12,7 +12,7 @@
 # -----------------------------------------------------------------------------
 
 # stdlib
-import json, os
+import gzip, json, os
 from typing import Optional
 
 from fastapi import FastAPI, Request
@@ -101,18 +101,49 @@ html,body{height:100%;margin:0;background:#0b1220;color:#e6e8ee;font-family:syst
 function logout(){ fetch('/logout').then(()=>location.href='/login'); }
 </script></body></html>"""
 
+# Static pages: encode and gzip once at import instead of on every request.
+_LOGIN_BYTES  = LOGIN_HTML.encode("utf-8")
+_LOGIN_GZ     = gzip.compress(_LOGIN_BYTES, 6)
+_VIEWER_BYTES = VIEWER_HTML.encode("utf-8")
+_VIEWER_GZ    = gzip.compress(_VIEWER_BYTES, 6)
+
+def accepts_gzip(request: Request) -> bool:
+    qvalues = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.lower()] = q
+    # An explicit "gzip" entry wins over the "*" wildcard; q=0 means refused.
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+def html_page(request: Request, raw: bytes, gz: bytes, cache: str) -> HTMLResponse:
+    # These pages depend on the session cookie (redirect / login gate), so
+    # callers pass a revalidating or non-storing Cache-Control.
+    headers = {"Cache-Control": cache, "Vary": "Accept-Encoding, Cookie"}
+    if accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=gz, headers=headers)
+    return HTMLResponse(content=raw, headers=headers)
+
 # ------------------------------ Routes ----------------------------------------
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
     if is_logged_in(request):
         return RedirectResponse(url="/viewer", status_code=302)
-    return HTMLResponse(LOGIN_HTML)
+    return html_page(request, _LOGIN_BYTES, _LOGIN_GZ, cache="no-cache")
 
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     if is_logged_in(request):
         return RedirectResponse(url="/viewer", status_code=302)
-    return HTMLResponse(LOGIN_HTML)
+    return html_page(request, _LOGIN_BYTES, _LOGIN_GZ, cache="no-cache")
 
 @app.post("/api/login")
 async def api_login(request: Request):
@@ -136,7 +167,8 @@ async def logout(request: Request):
 async def viewer(request: Request):
     if not is_logged_in(request):
         return RedirectResponse(url="/login", status_code=302)
-    return HTMLResponse(VIEWER_HTML)
+    # Behind login: never store, so logout keeps gating the page.
+    return html_page(request, _VIEWER_BYTES, _VIEWER_GZ, cache="no-store")
 
 @app.get("/api/status")
 async def status():